@@ -48,6 +48,7 @@ pyinstaller --noconfirm --onefile --windowed \
     --hidden-import "src.i18n" \
     --hidden-import "src.models" \
     --hidden-import "src.models.photo" \
+    --hidden-import "src.models.cache" \
     --hidden-import "src.ui" \
     --hidden-import "src.ui.main_window" \
     --hidden-import "src.ui.dialogs" \
@@ -6,6 +6,7 @@ Compatible with Windows and macOS (PyQt5)
 
 import sys
 import subprocess
+import multiprocessing
 
 
 def ensure_dependencies():
@@ -32,16 +33,39 @@ def ensure_dependencies():
         print("Dependencies installed successfully.")
 
 
-# Only check dependencies when running as script (not when frozen/built)
-if not getattr(sys, 'frozen', False):
+# Only check dependencies when running as script (not when frozen/built),
+# and not again in export worker processes, which re-import this module
+# as __mp_main__ on Windows and macOS
+if __name__ == "__main__" and not getattr(sys, 'frozen', False):
     ensure_dependencies()
 
-from PyQt5.QtWidgets import QApplication
+def check_jpeg_backend():
+    """Log the Pillow build and its JPEG codec (libjpeg-turbo expected)."""
+    import platform
+    import PIL
+    from PIL import features
 
-from src.ui import PhotoManagerApp
+    # pillow-simd versions carry a ".postN" suffix
+    is_simd = 'post' in PIL.__version__
+    print(f"Pillow {PIL.__version__}{' (SIMD)' if is_simd else ''}")
+    if not is_simd and platform.machine().lower() in ('x86_64', 'amd64'):
+        print("Hint: pillow-simd can speed up resizing and JPEG encoding on this CPU "
+              "(see requirements.txt).")
+
+    if features.check_feature('libjpeg_turbo'):
+        print(f"JPEG backend: libjpeg-turbo {features.version_feature('libjpeg_turbo')}")
+    else:
+        print("Warning: Pillow is not linked against libjpeg-turbo, "
+              "JPEG decoding and encoding will be slower.")
 
 
 def main():
+    # Imported here rather than at module level: export worker processes
+    # re-import this module and only need Pillow
+    from PyQt5.QtWidgets import QApplication
+    from src.ui import PhotoManagerApp
+
+    check_jpeg_backend()
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
     window = PhotoManagerApp()
@@ -50,4 +74,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for the export worker processes in frozen builds
+    multiprocessing.freeze_support()
     main()
@@ -1,18 +1,32 @@
 """Configuration and constants for the application"""
 
-# Supported image formats
-SUPPORTED_FORMATS = ('.jpg', '.jpeg', '.png', '.JPG', '.JPEG', '.PNG')
+import os
+
+# Supported image formats (lowercase, match against lowercased names)
+SUPPORTED_FORMATS = ('.jpg', '.jpeg', '.png')
 
 # Thumbnail size in pixels
 THUMB_SIZE = (100, 100)
 
+# In-memory thumbnail cache (~40 KB per decoded thumbnail)
+THUMB_MEMORY_CACHE_ENTRIES = 512
+
+# On-disk thumbnail cache (kept across sessions)
+THUMB_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'photo_manager', 'thumbs')
+THUMB_CACHE_MAX_BYTES = 100 * 1024 * 1024  # 100 MB
+THUMB_CACHE_QUALITY = 80  # JPEG quality of cached thumbnails
+
 
 class WordExportConfig:
     """Word export configuration"""
     PAGE_MARGIN_MM = 0  # No page margin
     GAP_MM = 2.4  
     DPI = 150  # Resolution for composite image
-    JPEG_QUALITY = 95  # JPEG quality
+    JPEG_QUALITY = 85  # JPEG quality (visually lossless at cell size)
+    JPEG_OPTIMIZE = True  # Extra Huffman pass: smaller file, slower encode
+    JPEG_PROGRESSIVE = False  # Multi-scan encode is ~2-3x slower for little or no size gain
+    JPEG_SUBSAMPLING = 2  # 4:2:0 chroma subsampling
+    POOL_MIN_PAGES = 3  # Smaller exports render inline, without worker processes
 
     # Available layouts: (columns, rows)
     LAYOUTS = {
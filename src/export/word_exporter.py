@@ -1,17 +1,87 @@
 """Export photos to Word document"""
 
+import copy
 import io
 import math
-from typing import List, Callable, Optional
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Iterable, List, Tuple
 
 from PIL import Image
 from PyQt5.QtCore import QThread, pyqtSignal
 from docx import Document
 from docx.shared import Mm
+from docx.enum.table import WD_TABLE_ALIGNMENT, WD_CELL_VERTICAL_ALIGNMENT
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
 
 from ..models import PhotoItem
 from ..config import WordExportConfig
+from ..page_renderer import render_page
+
+# Resampling filter for every downscale
+_RESAMPLE = Image.LANCZOS
+
+# Zero length, shared by the margins and spacings set on every page
+_MM0 = Mm(0)
+
+
+@lru_cache(maxsize=None)
+def _layout_geometry(ppp: int, image_size: str) -> Tuple[int, int, int, int]:
+    """Grid of a page as (cols, rows, cell width, gap), sizes in composite pixels"""
+    config = WordExportConfig
+
+    # Layout based on photos per page
+    cols, rows = config.LAYOUTS.get(ppp, (2, 3))
+
+    # Available width (A4 = 210mm)
+    available_w_mm = 210
+
+    # Gap between photos (FIXED, same horizontal and vertical)
+    gap_mm = config.GAP_MM
+
+    # Calculate cell width (fixed)
+    cell_w_mm = (available_w_mm - gap_mm * (cols - 1)) / cols
+
+    # Apply size factor to cells only (not to gaps)
+    size_factor = config.IMAGE_SIZES.get(image_size, 1.0)
+    cell_w_mm = cell_w_mm * size_factor
+
+    # Convert mm to pixels
+    mm_to_px = config.DPI / 25.4
+    cell_w_px = int(cell_w_mm * mm_to_px)
+    gap_px = int(gap_mm * mm_to_px)
+
+    return cols, rows, cell_w_px, gap_px
+
+
+def _build_tbl_w():
+    """Table width element in twips, its width left to set"""
+    tbl_w = OxmlElement('w:tblW')
+    tbl_w.set(qn('w:type'), 'dxa')
+    return tbl_w
+
+
+def _build_tbl_borders():
+    """Table borders element with every border removed"""
+    tbl_borders = OxmlElement('w:tblBorders')
+    for border_name in ['top', 'left', 'bottom', 'right', 'insideH', 'insideV']:
+        border = OxmlElement(f'w:{border_name}')
+        border.set(qn('w:val'), 'nil')
+        tbl_borders.append(border)
+    return tbl_borders
+
+
+# Same for every page: built once, deep-copied into each table
+_TBL_W = _build_tbl_w()
+_TBL_BORDERS = _build_tbl_borders()
+_W_W = qn('w:w')
+
 
 class WordExporter(QThread):
     """Thread for Word export"""
@@ -42,166 +112,87 @@ class WordExporter(QThread):
 
         # Configure page margins to 0 for proper centering
         for section in doc.sections:
-            section.top_margin = Mm(0)
-            section.bottom_margin = Mm(0)
-            section.left_margin = Mm(0)
-            section.right_margin = Mm(0)
-
-        # Layout based on photos per page
-        cols, rows = self.config.LAYOUTS.get(self.ppp, (2, 3))
-
-        # Available area (A4 = 210x297mm)
-        available_w_mm = 210
-        available_h_mm = 297
-
-        # Gap between photos (FIXED, same horizontal and vertical)
-        gap_mm = self.config.GAP_MM
-
-        # Calculate cell width (fixed)
-        cell_w_mm = (available_w_mm - gap_mm * (cols - 1)) / cols
-
-        # Apply size factor to cells only (not to gaps)
-        size_factor = self.config.IMAGE_SIZES.get(self.image_size, 1.0)
-        cell_w_mm = cell_w_mm * size_factor
+            section.top_margin = _MM0
+            section.bottom_margin = _MM0
+            section.left_margin = _MM0
+            section.right_margin = _MM0
 
-        # Convert mm to pixels
+        cols, rows, cell_w_px, gap_px = _layout_geometry(self.ppp, self.image_size)
         mm_to_px = self.config.DPI / 25.4
-        cell_w_px = int(cell_w_mm * mm_to_px)
-        gap_px = int(gap_mm * mm_to_px)
 
         total = len(self.photos)
         num_pages = math.ceil(total / self.ppp)
 
-        for page_idx in range(num_pages):
-            start = page_idx * self.ppp
-            end = min(start + self.ppp, total)
-            page_photos = self.photos[start:end]
-
-            # Calculate row heights based on tallest photo in each row
-            row_heights_px = []
-            for row_idx in range(rows):
-                row_start = row_idx * cols
-                row_end = min(row_start + cols, len(page_photos))
-                row_photos = page_photos[row_start:row_end]
-
-                if not row_photos:
-                    continue
-
-                # Find tallest photo in this row
-                max_h_px = 0
-                for photo in row_photos:
-                    try:
-                        with Image.open(photo.path) as img:
-                            img_w, img_h = img.size
-                            img_ratio = img_w / img_h
-                            new_w = cell_w_px
-                            new_h = int(new_w / img_ratio)
-                            max_h_px = max(max_h_px, new_h)
-                    except Exception as e:
-                        print(f"Error reading photo {photo.path}: {e}")
-
-                row_heights_px.append(max_h_px)
-
-            # Total composite height
-            composite_h_px = sum(row_heights_px) + gap_px * (len(row_heights_px) - 1)
-            composite_w_px = cols * cell_w_px + (cols - 1) * gap_px
-
-            # Create composite image (white background)
-            composite = Image.new('RGB', (composite_w_px, composite_h_px), (255, 255, 255))
-
-            y_pos = 0
-            for row_idx in range(rows):
-                row_start = row_idx * cols
-                row_end = min(row_start + cols, len(page_photos))
-                row_photos = page_photos[row_start:row_end]
-
-                if not row_photos:
-                    continue
-
-                row_h_px = row_heights_px[row_idx]
-
-                for col_idx in range(len(row_photos)):
-                    photo = row_photos[col_idx]
-                    x = col_idx * (cell_w_px + gap_px)
-
-                    # Place photo
-                    self._place_photo(composite, photo, x, y_pos, cell_w_px, row_h_px)
-
-                    # Update progress
-                    self.progress.emit(int((start + row_start + col_idx + 1) / total * 100))
-
-                y_pos += row_h_px + gap_px
-
-            # Insert composite image into document, centered on its own page
-            self._insert_composite(doc, composite, composite_w_px / mm_to_px, composite_h_px / mm_to_px, page_idx > 0)
-
-        doc.save(self.path)
-
-    def _place_photo(
+        # Page composites are independent: large exports render them in
+        # worker processes
+        jpeg_options = {
+            'quality': self.config.JPEG_QUALITY,
+            'optimize': self.config.JPEG_OPTIMIZE,
+            'progressive': self.config.JPEG_PROGRESSIVE,
+            'subsampling': self.config.JPEG_SUBSAMPLING,
+        }
+        geom = (cols, rows, cell_w_px, gap_px, jpeg_options)
+        page_photos = [
+            [(p.path, p.rotation) for p in self.photos[start:start + self.ppp]]
+            for start in range(0, total, self.ppp)
+        ]
+        # No more workers than pages (and at most 61 on Windows, a
+        # WaitForMultipleObjects limit)
+        max_workers = min(os.cpu_count() or 1, num_pages)
+        if sys.platform == 'win32':
+            max_workers = min(max_workers, 61)
+
+        if num_pages < self.config.POOL_MIN_PAGES or max_workers == 1:
+            # Render inline: starting the worker processes would take longer
+            results = map(render_page, page_photos, [geom] * num_pages)
+            self._insert_pages(doc, results, num_pages, mm_to_px)
+        else:
+            # Workers are spawned rather than forked: this process runs Qt
+            # and the thumbnail loader threads
+            mp_context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as pool:
+                # Results come back in page order: each page goes into the
+                # document as soon as it is ready while later ones still render
+                results = pool.map(render_page, page_photos, [geom] * num_pages)
+                self._insert_pages(doc, results, num_pages, mm_to_px)
+
+        # The zip is written part by part: a large buffer batches the small writes
+        with open(self.path, 'wb', buffering=1 << 20) as f:
+            doc.save(f)
+
+    def _insert_pages(
         self,
-        composite: Image.Image,
-        photo: PhotoItem,
-        x: int,
-        y: int,
-        cell_w: int,
-        cell_h: int
+        doc: Document,
+        results: Iterable[Tuple[bytes, int, int]],
+        num_pages: int,
+        mm_to_px: float
     ) -> None:
-        """Place a photo in the composite image (FIT width, height auto, centered vertically)"""
-        try:
-            with Image.open(photo.path) as img:
-                # Apply rotation
-                if photo.rotation:
-                    img = img.rotate(-photo.rotation, expand=True)
-
-                # Convert to RGB
-                if img.mode != 'RGB':
-                    if img.mode in ('RGBA', 'LA', 'P'):
-                        bg = Image.new('RGB', img.size, (255, 255, 255))
-                        if img.mode == 'P':
-                            img = img.convert('RGBA')
-                        if 'A' in img.getbands():
-                            bg.paste(img, mask=img.split()[-1])
-                        else:
-                            bg.paste(img)
-                        img = bg
-                    else:
-                        img = img.convert('RGB')
-
-                # FIT width, height auto
-                img_w, img_h = img.size
-                img_ratio = img_w / img_h
-                new_w = cell_w
-                new_h = int(new_w / img_ratio)
-
-                # Resize
-                resample = Image.LANCZOS if hasattr(Image, 'LANCZOS') else Image.ANTIALIAS
-                img_resized = img.resize((new_w, new_h), resample)
-
-                # Center vertically in cell
-                paste_x = x
-                paste_y = y + (cell_h - new_h) // 2
-
-                composite.paste(img_resized, (paste_x, paste_y))
+        """Insert the rendered page composites in order, reporting progress"""
+        last_pct = -1
+        last_emit = 0.0
+        for page_idx, (data, composite_w_px, composite_h_px) in enumerate(results):
+            # Insert composite image into document, centered on its own page
+            self._insert_composite(doc, data, composite_w_px / mm_to_px, composite_h_px / mm_to_px, page_idx > 0)
 
-        except Exception as e:
-            print(f"Error placing photo {photo.path}: {e}")
+            # Update progress (each emit is a queued cross-thread event
+            # and a repaint: at most 10 per second, 100% always sent)
+            pct = (page_idx + 1) * 100 // num_pages
+            now = time.monotonic()
+            if pct != last_pct and (now - last_emit >= 0.1 or pct == 100):
+                self.progress.emit(pct)
+                last_pct = pct
+                last_emit = now
 
     def _insert_composite(
         self,
         doc: Document,
-        composite: Image.Image,
+        data: bytes,
         width_mm: float,
         height_mm: float,
         new_page: bool = False
     ) -> None:
         """Insert the composite image into the document using a centered table"""
-        from docx.enum.table import WD_TABLE_ALIGNMENT, WD_CELL_VERTICAL_ALIGNMENT
-        from docx.oxml.ns import qn
-        from docx.oxml import OxmlElement
-
-        buf = io.BytesIO()
-        composite.save(buf, format='JPEG', quality=self.config.JPEG_QUALITY)
-        buf.seek(0)
+        buf = io.BytesIO(data)
 
         if new_page:
             doc.add_page_break()
@@ -213,7 +204,7 @@ class WordExporter(QThread):
         # Add spacing paragraph for vertical centering
         spacing_para = doc.add_paragraph()
         spacing_para.paragraph_format.space_before = Mm(vertical_offset)
-        spacing_para.paragraph_format.space_after = Mm(0)
+        spacing_para.paragraph_format.space_after = _MM0
 
         # Create a table with one cell to hold the image (better copy-paste centering)
         table = doc.add_table(rows=1, cols=1)
@@ -225,29 +216,23 @@ class WordExporter(QThread):
         tblPr = tbl.tblPr if tbl.tblPr is not None else OxmlElement('w:tblPr')
 
         # Set table width to match image (in twips: 1mm = 56.7 twips)
-        tblW = OxmlElement('w:tblW')
-        tblW.set(qn('w:w'), str(int(width_mm * 56.7)))
-        tblW.set(qn('w:type'), 'dxa')
+        tblW = copy.deepcopy(_TBL_W)
+        tblW.set(_W_W, str(int(width_mm * 56.7)))
         tblPr.append(tblW)
 
         # Remove borders
-        tblBorders = OxmlElement('w:tblBorders')
-        for border_name in ['top', 'left', 'bottom', 'right', 'insideH', 'insideV']:
-            border = OxmlElement(f'w:{border_name}')
-            border.set(qn('w:val'), 'nil')
-            tblBorders.append(border)
-        tblPr.append(tblBorders)
+        tblPr.append(copy.deepcopy(_TBL_BORDERS))
 
         if tbl.tblPr is None:
             tbl.insert(0, tblPr)
 
-        # Get the cell and add the image
-        cell = table.cell(0, 0)
+        # Get the cell and add the image (the only one: skip the grid lookup)
+        cell = table._cells[0]
         cell.vertical_alignment = WD_CELL_VERTICAL_ALIGNMENT.CENTER
 
         # Center the paragraph inside the cell
         para = cell.paragraphs[0]
         para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        para.paragraph_format.space_before = Mm(0)
-        para.paragraph_format.space_after = Mm(0)
+        para.paragraph_format.space_before = _MM0
+        para.paragraph_format.space_after = _MM0
         para.add_run().add_picture(buf, width=Mm(width_mm), height=Mm(height_mm))
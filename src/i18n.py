@@ -1,6 +1,6 @@
 """Internationalization module for the application"""
 
-from typing import Dict, Callable, List
+from typing import Dict, Callable
 from enum import Enum
 
 
@@ -149,6 +149,10 @@ class Translations:
             "en": "Press Esc to close",
             "fr": "Appuyez sur Echap pour fermer"
         },
+        "loading": {
+            "en": "Loading...",
+            "fr": "Chargement..."
+        },
         "loading_error": {
             "en": "Loading error",
             "fr": "Erreur de chargement"
@@ -182,14 +186,20 @@ class Translations:
     }
 
     _current_language: Language = Language.FRENCH
-    _listeners: List[Callable[[], None]] = []
+    _current_strings: Dict[str, str] = {}  # key -> string in the current language
+    # Insertion-ordered set of callbacks (bound methods are recreated on each
+    # access, so a WeakSet would drop them at once)
+    _listeners: Dict[Callable[[], None], None] = {}
 
     @classmethod
     def get(cls, key: str) -> str:
         """Get translated string for the current language"""
-        if key in cls._strings:
-            return cls._strings[key].get(cls._current_language.value, key)
-        return key
+        return cls._current_strings.get(key, key)
+
+    @classmethod
+    def _strings_for(cls, language: Language) -> Dict[str, str]:
+        """All strings of a language, missing ones falling back to their key"""
+        return {key: values.get(language.value, key) for key, values in cls._strings.items()}
 
     @classmethod
     def get_language(cls) -> Language:
@@ -201,6 +211,7 @@ class Translations:
         """Set the current language and notify listeners"""
         if cls._current_language != language:
             cls._current_language = language
+            cls._current_strings = cls._strings_for(language)
             cls._notify_listeners()
 
     @classmethod
@@ -214,25 +225,27 @@ class Translations:
     @classmethod
     def add_listener(cls, callback: Callable[[], None]) -> None:
         """Add a listener for language changes"""
-        if callback not in cls._listeners:
-            cls._listeners.append(callback)
+        cls._listeners[callback] = None
 
     @classmethod
     def remove_listener(cls, callback: Callable[[], None]) -> None:
         """Remove a language change listener"""
-        if callback in cls._listeners:
-            cls._listeners.remove(callback)
+        cls._listeners.pop(callback, None)
 
     @classmethod
     def _notify_listeners(cls) -> None:
         """Notify all listeners of language change"""
-        for listener in cls._listeners:
+        # Copy: a listener may add or remove listeners
+        for listener in list(cls._listeners):
             try:
                 listener()
             except Exception:
                 pass
 
 
+Translations._current_strings = Translations._strings_for(Translations._current_language)
+
+
 # Shortcut function
 def tr(key: str) -> str:
     """Shortcut for Translations.get()"""
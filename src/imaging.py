@@ -0,0 +1,51 @@
+"""Pillow image helpers (no Qt import: also used by the export workers)"""
+
+from PIL import Image
+
+
+# Clockwise rotation in degrees -> lossless transpose
+_ROTATIONS = {
+    90: Image.ROTATE_270,
+    180: Image.ROTATE_180,
+    270: Image.ROTATE_90,
+}
+
+
+# EXIF Orientation tag -> transpose that makes the image upright
+_ORIENTATIONS = {
+    2: Image.FLIP_LEFT_RIGHT,
+    3: Image.ROTATE_180,
+    4: Image.FLIP_TOP_BOTTOM,
+    5: Image.TRANSPOSE,
+    6: Image.ROTATE_270,
+    7: Image.TRANSVERSE,
+    8: Image.ROTATE_90,
+}
+
+
+def rotate_image(img: Image.Image, rotation: int) -> Image.Image:
+    """Rotate clockwise by a multiple of 90 degrees (pixel permutation, no resampling)"""
+    if not rotation:
+        return img
+    return img.transpose(_ROTATIONS[rotation])
+
+
+def get_orientation(img: Image.Image) -> int:
+    """EXIF Orientation of an opened image (read from the header, 1 if absent)"""
+    try:
+        return img.getexif().get(0x0112, 1)
+    except Exception:
+        return 1
+
+
+def orient_image(img: Image.Image, orientation: int) -> Image.Image:
+    """Apply an EXIF Orientation so that the image is upright"""
+    method = _ORIENTATIONS.get(orientation)
+    if method is None:
+        return img
+    return img.transpose(method)
+
+
+def swaps_axes(orientation: int, rotation: int) -> bool:
+    """Whether orienting then rotating an image swaps its width and height"""
+    return (orientation in (5, 6, 7, 8)) != (rotation in (90, 270))
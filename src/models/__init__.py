@@ -1,3 +1,3 @@
-from .photo import PhotoItem
+from .photo import PhotoItem, rotate_image, get_orientation, orient_image, swaps_axes
 
-__all__ = ['PhotoItem']
+__all__ = ['PhotoItem', 'rotate_image', 'get_orientation', 'orient_image', 'swaps_axes']
@@ -0,0 +1,151 @@
+"""Caches for decoded thumbnails"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Optional, Tuple
+
+from PIL import Image
+
+from ..config import (
+    THUMB_CACHE_DIR, THUMB_CACHE_MAX_BYTES, THUMB_CACHE_QUALITY, THUMB_MEMORY_CACHE_ENTRIES
+)
+
+# Raw BGRX pixels with their width and height
+ThumbData = Tuple[bytes, int, int]
+
+# Bumped whenever the content of the disk cache files changes
+_DISK_CACHE_VERSION = 2
+
+# Temporary files older than this were left by an interrupted write
+_STALE_TMP_SECONDS = 60
+
+
+class ThumbCache:
+    """Process-wide LRU of decoded thumbnails (thread-safe)
+
+    Stores raw bytes rather than QPixmap, which only lives in the GUI thread.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, ThumbData]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[ThumbData]:
+        """Return the cached thumbnail, marking it as recently used"""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+            return data
+
+    def put(self, key: Hashable, data: ThumbData) -> None:
+        """Store a thumbnail, evicting the oldest ones over capacity"""
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached thumbnails"""
+        with self._lock:
+            self._entries.clear()
+
+
+class ThumbDiskCache:
+    """Thumbnails persisted as small JPEG files across sessions (thread-safe)
+
+    Thumbnails are stored upright (EXIF orientation applied) but without the
+    user rotation, in files named after a hash of (path, mtime), so an edited
+    photo simply misses. The least recently accessed files are evicted once
+    the directory grows over max_bytes.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, quality: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.quality = quality
+        self._size: Optional[int] = None  # Computed on first write
+        self._lock = threading.Lock()
+
+    def _cache_path(self, path: str) -> str:
+        """File holding the thumbnail of a photo"""
+        key = f"{_DISK_CACHE_VERSION}:{path}:{os.path.getmtime(path)}"
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest() + '.jpg')
+
+    def get_or_build(self, path: str, build: Callable[[], Image.Image]) -> Image.Image:
+        """Return the cached RGB thumbnail, or build and store it"""
+        cache_path = self._cache_path(path)
+        try:
+            with Image.open(cache_path) as img:
+                img.load()
+                return img
+        except (OSError, ValueError):
+            pass
+
+        img = build()
+        # Write under a unique name first: another thread may build the same file
+        tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            img.save(tmp_path, 'JPEG', quality=self.quality)
+            os.replace(tmp_path, cache_path)
+            self._add_size(os.path.getsize(cache_path))
+        except OSError as e:
+            print(f"Error caching thumbnail of {path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        return img
+
+    def _add_size(self, nbytes: int) -> None:
+        """Account for a written file and evict when over capacity"""
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._entries())
+            else:
+                self._size += nbytes
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> List[Tuple[str, int, float]]:
+        """Cached thumbnail files as (path, size, access time)
+
+        Stale temporary files (from a crash between a write and its rename)
+        are removed on the way.
+        """
+        entries = []
+        now = time.time()
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                try:
+                    if entry.name.endswith('.jpg'):
+                        st = entry.stat()
+                        entries.append((entry.path, st.st_size, st.st_atime))
+                    elif entry.name.endswith('.tmp') and now - entry.stat().st_mtime > _STALE_TMP_SECONDS:
+                        os.remove(entry.path)
+                except OSError:
+                    continue  # Removed meanwhile
+        return entries
+
+    def _evict(self) -> None:
+        """Remove least recently accessed files down to 80% of capacity"""
+        target = self.max_bytes * 0.8
+        for path, size, _ in sorted(self._entries(), key=lambda entry: entry[2]):
+            if self._size <= target:
+                break
+            try:
+                os.remove(path)
+                self._size -= size
+            except OSError:
+                pass
+
+
+# Shared by all PhotoItems
+thumb_cache = ThumbCache(THUMB_MEMORY_CACHE_ENTRIES)
+thumb_disk_cache = ThumbDiskCache(THUMB_CACHE_DIR, THUMB_CACHE_MAX_BYTES, THUMB_CACHE_QUALITY)
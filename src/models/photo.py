@@ -1,88 +1,174 @@
 """Photo data model"""
 
+import hashlib
 import os
-from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Tuple
 
 from PIL import Image
-from PyQt5.QtGui import QPixmap, QImage
+from PyQt5.QtGui import QImage
 
 from ..config import THUMB_SIZE
+from ..imaging import rotate_image, get_orientation, orient_image, swaps_axes
+from .cache import ThumbData, thumb_cache, thumb_disk_cache
+
+# Resampling filter for every downscale
+_RESAMPLE = Image.LANCZOS
+
+
+def _to_qimage(img: Image.Image) -> QImage:
+    """Convert an RGB PIL image to QImage (safe outside the GUI thread)
+
+    Pixels are packed as 32-bit BGRX, the native layout of Format_RGB32, so
+    Qt takes them as-is instead of converting from RGB888. The QImage keeps
+    a reference to the packed bytes.
+    """
+    data = img.tobytes("raw", "BGRX")
+    return QImage(data, img.width, img.height, 4 * img.width, QImage.Format_RGB32)
 
 
-@dataclass
 class PhotoItem:
     """Represents a photo with its metadata"""
-    path: str
-    rotation: int = 0
-    _pixmap: Optional[QPixmap] = field(default=None, repr=False)
+
+    # No per-instance __dict__: thousands of photos may be loaded
+    __slots__ = ('path', 'rotation', '_content_hash')
+
+    def __init__(self, path: str, rotation: int = 0):
+        self.path = path
+        self.rotation = rotation
+        self._content_hash: Optional[Tuple[float, str]] = None  # (mtime, hash)
+
+    def __repr__(self) -> str:
+        return f"PhotoItem(path={self.path!r}, rotation={self.rotation!r})"
 
     @property
     def filename(self) -> str:
         """Returns the filename"""
         return os.path.basename(self.path)
 
+    def get_content_hash(self) -> str:
+        """Hash of the file size, first and last 16 KB, shared by copies of a photo"""
+        mtime = os.path.getmtime(self.path)
+        if self._content_hash is None or self._content_hash[0] != mtime:
+            size = os.path.getsize(self.path)
+            with open(self.path, 'rb') as f:
+                digest = hashlib.blake2b(f.read(16384), digest_size=16)
+                # Photos may share their first 16 KB (large identical EXIF
+                # blocks, screenshots with the same top strip): the end of the
+                # file tells them apart
+                if size > 16384:
+                    f.seek(max(16384, size - 16384))
+                    digest.update(f.read())
+            digest.update(str(size).encode())
+            self._content_hash = (mtime, digest.hexdigest())
+        return self._content_hash[1]
+
     def rotate(self) -> None:
         """Rotate 90 degrees clockwise"""
         self.rotation = (self.rotation + 90) % 360
-        self._pixmap = None
-
-    def get_pixmap(self) -> Optional[QPixmap]:
-        """Returns the thumbnail as QPixmap"""
-        if self._pixmap:
-            return self._pixmap
-        try:
-            with Image.open(self.path) as img:
-                # Apply rotation
-                if self.rotation:
-                    img = img.rotate(-self.rotation, expand=True)
-
-                # Convert to RGB
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
 
-                # Use appropriate resampling method
-                resample = Image.LANCZOS if hasattr(Image, 'LANCZOS') else Image.ANTIALIAS
-                img.thumbnail(THUMB_SIZE, resample)
+    def cached_thumbnail(self) -> Optional[QImage]:
+        """Return the thumbnail if already decoded, without touching the file"""
+        if self._content_hash is None:
+            return None
+        cached = thumb_cache.get((self._content_hash[1], self.rotation))
+        if cached is None:
+            return None
+        data, width, height = cached
+        return QImage(data, width, height, 4 * width, QImage.Format_RGB32)
 
-                # Convert to QPixmap
-                data = img.tobytes("raw", "RGB")
-                qimg = QImage(data, img.width, img.height, 3 * img.width, QImage.Format_RGB888)
-                self._pixmap = QPixmap.fromImage(qimg)
-                return self._pixmap
+    def load_thumbnail(self) -> Optional[QImage]:
+        """Decode the thumbnail as QImage (safe to call from a worker thread)"""
+        try:
+            rotation = self.rotation
+            # Keyed by content so copies of a photo share one decode
+            key = (self.get_content_hash(), rotation)
+            cached = thumb_cache.get(key)
+            if cached is None:
+                cached = self._decode_thumbnail(rotation)
+                thumb_cache.put(key, cached)
+            data, width, height = cached
+            return QImage(data, width, height, 4 * width, QImage.Format_RGB32)
         except Exception as e:
             print(f"Error loading {self.path}: {e}")
             return None
 
-    def get_full_image(self, max_width: int, max_height: int) -> Optional[QPixmap]:
-        """Returns the full-size image scaled to fit within max dimensions"""
+    def _decode_thumbnail(self, rotation: int) -> ThumbData:
+        """Decode the thumbnail pixels as packed BGRX bytes"""
+        # The disk cache holds the unrotated thumbnail: rotating it is cheap
+        img = thumb_disk_cache.get_or_build(self.path, self._build_thumbnail)
+        if rotation:
+            img = rotate_image(img, rotation)
+
+        # Fit the final box (no-op while THUMB_SIZE is square)
+        img.thumbnail(THUMB_SIZE, _RESAMPLE)
+        return img.tobytes("raw", "BGRX"), img.width, img.height
+
+    def _build_thumbnail(self) -> Image.Image:
+        """Decode the original photo down to an upright, unrotated RGB thumbnail"""
+        with Image.open(self.path) as img:
+            orientation = get_orientation(img)
+
+            # Square box: the thumbnail may be rotated afterwards
+            side = max(THUMB_SIZE)
+
+            # Let libjpeg downscale while decoding (no-op for other formats)
+            img.draft('RGB', (side, side))
+
+            # Convert to RGB first unless it can wait until the image is
+            # thumbnail-sized (JPEG modes)
+            if img.mode not in ('RGB', 'L'):
+                img = img.convert('RGB')
+
+            img.thumbnail((side, side), _RESAMPLE)
+
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+
+            # Orient the small image rather than the decoded original
+            img = orient_image(img, orientation)
+
+            # A small upright RGB JPEG goes through every step above
+            # untouched: read it before the file is closed
+            img.load()
+            return img
+
+    def load_full_image(self, max_width: int, max_height: int) -> Optional[QImage]:
+        """Decode the full-size image as QImage (safe to call from a worker thread)"""
         try:
             with Image.open(self.path) as img:
-                # Apply rotation
-                if self.rotation:
-                    img = img.rotate(-self.rotation, expand=True)
+                orientation = get_orientation(img)
+                quarter_turn = swaps_axes(orientation, self.rotation)
 
-                # Convert to RGB
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-
-                # Calculate scale factor
+                # Calculate scale factor (on the rotated size)
                 img_w, img_h = img.size
+                if quarter_turn:
+                    img_w, img_h = img_h, img_w
                 scale = min(max_width / img_w, max_height / img_h, 1.0)
                 new_w = int(img_w * scale)
                 new_h = int(img_h * scale)
 
-                # Resize with high quality
-                resample = Image.LANCZOS if hasattr(Image, 'LANCZOS') else Image.ANTIALIAS
-                img = img.resize((new_w, new_h), resample)
+                # Convert to RGB first unless it can wait until after the
+                # reduction (JPEG modes), so that draft decoding still applies
+                if img.mode not in ('RGB', 'L'):
+                    img = img.convert('RGB')
+
+                # Downscale before rotating: thumbnail() lets libjpeg decode at
+                # 1/2-1/8 scale and box-reduces before the final Lanczos pass
+                img.thumbnail((new_h, new_w) if quarter_turn else (new_w, new_h), _RESAMPLE, reducing_gap=2.0)
+
+                if img.mode != 'RGB':
+                    img = img.convert('RGB')
+
+                # Apply EXIF orientation, then rotation
+                img = orient_image(img, orientation)
+                if self.rotation:
+                    img = rotate_image(img, self.rotation)
 
-                # Convert to QPixmap
-                data = img.tobytes("raw", "RGB")
-                qimg = QImage(data, img.width, img.height, 3 * img.width, QImage.Format_RGB888)
-                return QPixmap.fromImage(qimg)
+                return _to_qimage(img)
         except Exception:
             return None
 
     def clear(self) -> None:
         """Free memory"""
-        self._pixmap = None
+        # Thumbnails live in the shared thumb_cache, which bounds its own size
+        self._content_hash = None
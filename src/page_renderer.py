@@ -0,0 +1,136 @@
+"""Rendering of export page composites (in the export worker processes, or
+inline for small exports)
+
+Kept out of src.export, whose package imports Qt and python-docx, so that
+spawned workers only import Pillow.
+"""
+
+import io
+from typing import Any, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from .imaging import rotate_image, get_orientation, orient_image, swaps_axes
+
+# Resampling filter for every downscale
+_RESAMPLE = Image.LANCZOS
+
+
+def render_page(
+    photo_paths_rotations: List[Tuple[str, int]],
+    geom: Tuple[int, int, int, int, Dict[str, Any]]
+) -> Tuple[bytes, int, int]:
+    """Build the composite image of one page (picklable, for worker processes)
+
+    Returns the JPEG-encoded composite and its size in pixels.
+    """
+    cols, rows, cell_w_px, gap_px, jpeg_options = geom
+
+    # Open each photo once and measure it from its header: its height at
+    # the cell width (as displayed: oriented and rotated) and its EXIF
+    # orientation are reused when the same handle is decoded and placed
+    images: List[Optional[Image.Image]] = []
+    placements: List[Tuple[int, int]] = []  # (orientation, height in pixels)
+    for path, rotation in photo_paths_rotations:
+        try:
+            img = Image.open(path)
+        except Exception as e:
+            print(f"Error reading photo {path}: {e}")
+            images.append(None)
+            placements.append((1, 0))
+            continue
+        orientation = get_orientation(img)
+        img_w, img_h = img.size
+        if swaps_axes(orientation, rotation):
+            img_w, img_h = img_h, img_w
+        images.append(img)
+        placements.append((orientation, int(cell_w_px * img_h / img_w)))
+
+    try:
+        # Row height = tallest photo in the row
+        row_heights_px = [
+            max(h for _, h in placements[row_start:row_start + cols])
+            for row_start in range(0, min(len(placements), rows * cols), cols)
+        ]
+
+        # Total composite height
+        composite_h_px = sum(row_heights_px) + gap_px * (len(row_heights_px) - 1)
+        composite_w_px = cols * cell_w_px + (cols - 1) * gap_px
+
+        # Create composite image (white background)
+        composite = Image.new('RGB', (composite_w_px, composite_h_px), (255, 255, 255))
+
+        y_pos = 0
+        for row_idx, row_h_px in enumerate(row_heights_px):
+            row_start = row_idx * cols
+            row_photos = photo_paths_rotations[row_start:row_start + cols]
+
+            for col_idx, (path, rotation) in enumerate(row_photos):
+                img = images[row_start + col_idx]
+                if img is None:
+                    continue
+                x = col_idx * (cell_w_px + gap_px)
+
+                # Place photo
+                orientation, new_h = placements[row_start + col_idx]
+                _place_photo(composite, img, path, orientation, rotation, x, y_pos, cell_w_px, new_h, row_h_px)
+
+            y_pos += row_h_px + gap_px
+    finally:
+        for img in images:
+            if img is not None:
+                img.close()
+
+    buf = io.BytesIO()
+    composite.save(buf, format='JPEG', **jpeg_options)
+    return buf.getvalue(), composite_w_px, composite_h_px
+
+
+def _place_photo(
+    composite: Image.Image,
+    img: Image.Image,
+    path: str,
+    orientation: int,
+    rotation: int,
+    x: int,
+    y: int,
+    new_w: int,
+    new_h: int,
+    cell_h: int
+) -> None:
+    """Place an opened photo at new_w x new_h (as displayed), centered vertically in its cell"""
+    try:
+        quarter_turn = swaps_axes(orientation, rotation)
+        target = (new_h, new_w) if quarter_turn else (new_w, new_h)
+
+        # Let libjpeg decode at 1/2-1/8 scale while keeping at least twice
+        # the target size for the Lanczos pass (no-op for other formats)
+        img.draft('RGB', (target[0] * 2, target[1] * 2))
+
+        # Convert to RGB (JPEGs usually are already). Transparent images
+        # stay RGBA and are blended when pasted: the composite is white.
+        if img.mode != 'RGB':
+            if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
+                img = img.convert('RGBA')
+            else:
+                img = img.convert('RGB')
+
+        # Resize before rotating so the rotation only touches cell-sized
+        # pixels (integer box reduction first, Lanczos on what is left;
+        # a gap of 3 is indistinguishable from a full Lanczos pass)
+        img_resized = img.resize(target, _RESAMPLE, reducing_gap=3.0)
+
+        # Apply EXIF orientation, then rotation
+        img_resized = orient_image(img_resized, orientation)
+        if rotation:
+            img_resized = rotate_image(img_resized, rotation)
+
+        # Center vertically in cell
+        paste_x = x
+        paste_y = y + (cell_h - new_h) // 2
+
+        mask = img_resized if img_resized.mode == 'RGBA' else None
+        composite.paste(img_resized, (paste_x, paste_y), mask)
+
+    except Exception as e:
+        print(f"Error placing photo {path}: {e}")
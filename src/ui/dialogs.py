@@ -1,15 +1,102 @@
 """Application dialogs"""
 
+from collections import OrderedDict
+from typing import Optional
+
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QApplication, QFrame, QGraphicsDropShadowEffect, QSizeGrip
 )
-from PyQt5.QtCore import Qt, QRect, QPoint, QSize
-from PyQt5.QtGui import QFont, QColor, QKeyEvent, QCursor, QPainter, QPen, QBrush
+from PyQt5.QtCore import Qt, QRect, QPoint, QSize, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QFont, QColor, QKeyEvent, QCursor, QPainter, QPen, QPixmap, QImage
 
 from ..models import PhotoItem
 from ..i18n import tr
 from .styles import Colors, SYSTEM_FONT
+import sip
+
+# Last full-size pixmaps shown, shared across viewer dialogs
+# Key: (path, rotation, max_width, max_height)
+_FULL_PIXMAP_CACHE: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+_FULL_PIXMAP_CACHE_SIZE = 4
+# Resized viewers round the image box down to this step, so that small
+# drags reuse a cached pixmap
+_RESIZE_BUCKET = 32
+_full_pixmap_cache_hooked = False
+
+
+def _get_full_pixmap(photo: PhotoItem, max_width: int, max_height: int) -> Optional[QPixmap]:
+    """Return a recently shown full-size pixmap of a photo, if any"""
+    key = (photo.path, photo.rotation, max_width, max_height)
+    pixmap = _FULL_PIXMAP_CACHE.get(key)
+    if pixmap is not None:
+        _FULL_PIXMAP_CACHE.move_to_end(key)
+    return pixmap
+
+
+def _put_full_pixmap(photo: PhotoItem, max_width: int, max_height: int, pixmap: QPixmap) -> None:
+    """Remember a full-size pixmap, evicting the oldest ones over capacity"""
+    global _full_pixmap_cache_hooked
+    if not _full_pixmap_cache_hooked:
+        # Release the pixmaps before Qt tears down
+        QApplication.instance().aboutToQuit.connect(_FULL_PIXMAP_CACHE.clear)
+        _full_pixmap_cache_hooked = True
+    _FULL_PIXMAP_CACHE[(photo.path, photo.rotation, max_width, max_height)] = pixmap
+    while len(_FULL_PIXMAP_CACHE) > _FULL_PIXMAP_CACHE_SIZE:
+        _FULL_PIXMAP_CACHE.popitem(last=False)
+
+
+# Resize edges as bit flags: a corner is the union of its two edges
+_EDGE_TOP = 1
+_EDGE_BOTTOM = 2
+_EDGE_LEFT = 4
+_EDGE_RIGHT = 8
+_EDGE_TOP_LEFT = _EDGE_TOP | _EDGE_LEFT
+_EDGE_TOP_RIGHT = _EDGE_TOP | _EDGE_RIGHT
+_EDGE_BOTTOM_LEFT = _EDGE_BOTTOM | _EDGE_LEFT
+_EDGE_BOTTOM_RIGHT = _EDGE_BOTTOM | _EDGE_RIGHT
+
+# Cursor for each edge mask (opposite edges only meet in a tiny dialog)
+_EDGE_CURSORS = (
+    Qt.ArrowCursor,       # none
+    Qt.SizeVerCursor,     # top
+    Qt.SizeVerCursor,     # bottom
+    Qt.ArrowCursor,       # top + bottom
+    Qt.SizeHorCursor,     # left
+    Qt.SizeFDiagCursor,   # top-left
+    Qt.SizeBDiagCursor,   # bottom-left
+    Qt.ArrowCursor,
+    Qt.SizeHorCursor,     # right
+    Qt.SizeBDiagCursor,   # top-right
+    Qt.SizeFDiagCursor,   # bottom-right
+    Qt.ArrowCursor,
+    Qt.ArrowCursor,
+    Qt.ArrowCursor,
+    Qt.ArrowCursor,
+    Qt.ArrowCursor,
+)
+
+
+class FullImageSignals(QObject):
+    """Signals for FullImageLoader (QRunnable is not a QObject)"""
+
+    image_ready = pyqtSignal(object, int, int)  # QImage or None, max width, max height
+
+
+class FullImageLoader(QRunnable):
+    """Decode a full-size photo on a worker thread"""
+
+    def __init__(self, photo: PhotoItem, max_width: int, max_height: int):
+        super().__init__()
+        self.photo = photo
+        self.max_width = max_width
+        self.max_height = max_height
+        self.signals = FullImageSignals()
+
+    def run(self) -> None:
+        """Decode the image (QImage only, QPixmap is GUI-thread only)"""
+        qimg = self.photo.load_full_image(self.max_width, self.max_height)
+        self.signals.image_ready.emit(qimg, self.max_width, self.max_height)
 
 
 class ImageViewerDialog(QDialog):
@@ -21,6 +108,67 @@ class ImageViewerDialog(QDialog):
     MIN_HEIGHT = 300
     # Visual grip size in corners
     GRIP_SIZE = 24
+    # Thickness of the hovered edge highlight
+    EDGE_HIGHLIGHT_WIDTH = 2
+    # Blurred drop shadow: re-rendered offscreen on every repaint, which
+    # makes resizing stutter on weak GPUs
+    ENABLE_SHADOW = False
+
+    # Single stylesheet for the whole dialog, built once (Colors never change
+    # at runtime). The container rule also styles the QFrames inside it
+    # (labels included), so the more specific rules repeat the ancestor ids to
+    # take precedence over it.
+    STYLESHEET = f"""
+        QFrame#viewerContainer, QFrame#viewerContainer QFrame {{
+            background: {Colors.BG_DARK};
+            border-radius: 20px;
+            border: 1px solid {Colors.BORDER};
+        }}
+        QFrame#viewerContainer QLabel#viewerTitle {{
+            color: {Colors.TEXT_PRIMARY};
+            background: transparent;
+        }}
+        QPushButton#viewerCloseX {{
+            background: {Colors.BG_CARD};
+            color: {Colors.TEXT_SECONDARY};
+            border: none;
+            border-radius: 20px;
+        }}
+        QPushButton#viewerCloseX:hover {{
+            background: {Colors.DANGER};
+            color: white;
+        }}
+        QFrame#viewerContainer QFrame#viewerImageFrame,
+        QFrame#viewerContainer QFrame#viewerImageFrame QFrame {{
+            background: {Colors.BG_CARD};
+            border-radius: 16px;
+        }}
+        QFrame#viewerContainer QFrame#viewerImageFrame QLabel#viewerImage {{
+            background: transparent;
+        }}
+        QFrame#viewerContainer QFrame#viewerImageFrame QLabel#viewerImage[state="loading"] {{
+            color: {Colors.TEXT_MUTED};
+        }}
+        QFrame#viewerContainer QFrame#viewerImageFrame QLabel#viewerImage[state="error"] {{
+            color: {Colors.DANGER};
+            font-size: 16px;
+        }}
+        QFrame#viewerContainer QLabel#viewerInfo {{
+            color: {Colors.TEXT_MUTED};
+            background: transparent;
+        }}
+        QPushButton#viewerCloseButton {{
+            background: {Colors.PRIMARY};
+            color: white;
+            border: none;
+            border-radius: 10px;
+            padding: 12px 32px;
+            font-weight: 500;
+        }}
+        QPushButton#viewerCloseButton:hover {{
+            background: {Colors.PRIMARY_HOVER};
+        }}
+    """
 
     def __init__(self, photo: PhotoItem, parent=None):
         super().__init__(parent)
@@ -33,9 +181,22 @@ class ImageViewerDialog(QDialog):
 
         # Resize state
         self._resizing = False
-        self._resize_edge = None
+        self._resize_edge = 0
         self._drag_pos = None
-        self._hover_edge = None  # Track which edge is being hovered
+        self._hover_edge = 0  # Track which edge is being hovered
+        self._grip_pixmaps = None  # Corner -> hover grip QPixmap
+
+        # Coalesce reloads so that one resize gesture decodes the image once
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(80)
+        self._reload_timer.timeout.connect(self._reload_image)
+        self._last_rendered_size = None  # (available_w, available_h) of the shown pixmap
+        self._user_resized = False  # The dialog size was chosen by the user
+
+        # Full-size decode in progress
+        self._loader: Optional[FullImageLoader] = None
+        self._pending_size = None  # (available_w, available_h) being decoded
 
         # Max size = 90% of screen
         screen = QApplication.primaryScreen().geometry()
@@ -46,6 +207,8 @@ class ImageViewerDialog(QDialog):
 
     def _setup_ui(self) -> None:
         """Setup the dialog interface"""
+        self.setStyleSheet(self.STYLESHEET)
+
         # Transparent outer layout with margin for resize detection
         outer_layout = QVBoxLayout(self)
         margin = self.RESIZE_MARGIN
@@ -54,21 +217,16 @@ class ImageViewerDialog(QDialog):
         # Main styled container
         container = QFrame()
         container.setMouseTracking(True)  # Propagate mouse tracking
-        container.setStyleSheet(f"""
-            QFrame {{
-                background: {Colors.BG_DARK};
-                border-radius: 20px;
-                border: 1px solid {Colors.BORDER};
-            }}
-        """)
+        container.setObjectName("viewerContainer")
 
         # Shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(50)
-        shadow.setXOffset(0)
-        shadow.setYOffset(10)
-        shadow.setColor(QColor(0, 0, 0, 150))
-        container.setGraphicsEffect(shadow)
+        if self.ENABLE_SHADOW:
+            shadow = QGraphicsDropShadowEffect()
+            shadow.setBlurRadius(50)
+            shadow.setXOffset(0)
+            shadow.setYOffset(10)
+            shadow.setColor(QColor(0, 0, 0, 150))
+            container.setGraphicsEffect(shadow)
 
         layout = QVBoxLayout(container)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -81,7 +239,7 @@ class ImageViewerDialog(QDialog):
         # Title
         title = QLabel(self.photo.filename)
         title.setFont(QFont(SYSTEM_FONT, 14, QFont.Bold))
-        title.setStyleSheet(f"color: {Colors.TEXT_PRIMARY}; background: transparent;")
+        title.setObjectName("viewerTitle")
         header.addWidget(title)
 
         header.addStretch()
@@ -91,18 +249,7 @@ class ImageViewerDialog(QDialog):
         close_btn.setFixedSize(40, 40)
         close_btn.setCursor(Qt.PointingHandCursor)
         close_btn.setFont(QFont(SYSTEM_FONT, 20))
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: {Colors.BG_CARD};
-                color: {Colors.TEXT_SECONDARY};
-                border: none;
-                border-radius: 20px;
-            }}
-            QPushButton:hover {{
-                background: {Colors.DANGER};
-                color: white;
-            }}
-        """)
+        close_btn.setObjectName("viewerCloseX")
         close_btn.clicked.connect(self.close)
         header.addWidget(close_btn)
 
@@ -110,12 +257,7 @@ class ImageViewerDialog(QDialog):
 
         # Image container with background
         img_frame = QFrame()
-        img_frame.setStyleSheet(f"""
-            QFrame {{
-                background: {Colors.BG_CARD};
-                border-radius: 16px;
-            }}
-        """)
+        img_frame.setObjectName("viewerImageFrame")
 
         img_layout = QVBoxLayout(img_frame)
         img_layout.setContentsMargins(16, 16, 16, 16)
@@ -123,7 +265,7 @@ class ImageViewerDialog(QDialog):
         # Image label
         self.img_label = QLabel()
         self.img_label.setAlignment(Qt.AlignCenter)
-        self.img_label.setStyleSheet("background: transparent;")
+        self.img_label.setObjectName("viewerImage")
         img_layout.addWidget(self.img_label)
 
         layout.addWidget(img_frame)
@@ -135,7 +277,7 @@ class ImageViewerDialog(QDialog):
         # Info label
         info_label = QLabel(tr("press_esc"))
         info_label.setFont(QFont(SYSTEM_FONT, 10))
-        info_label.setStyleSheet(f"color: {Colors.TEXT_MUTED}; background: transparent;")
+        info_label.setObjectName("viewerInfo")
         footer.addWidget(info_label)
 
         footer.addStretch()
@@ -144,19 +286,7 @@ class ImageViewerDialog(QDialog):
         close_btn_bottom = QPushButton(tr("close"))
         close_btn_bottom.setCursor(Qt.PointingHandCursor)
         close_btn_bottom.setFont(QFont(SYSTEM_FONT, 11))
-        close_btn_bottom.setStyleSheet(f"""
-            QPushButton {{
-                background: {Colors.PRIMARY};
-                color: white;
-                border: none;
-                border-radius: 10px;
-                padding: 12px 32px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background: {Colors.PRIMARY_HOVER};
-            }}
-        """)
+        close_btn_bottom.setObjectName("viewerCloseButton")
         close_btn_bottom.clicked.connect(self.close)
         footer.addWidget(close_btn_bottom)
 
@@ -174,27 +304,73 @@ class ImageViewerDialog(QDialog):
         available_w = self.max_w - 80 - extra_margin
         available_h = self.max_h - 180 - extra_margin
 
-        pixmap = self.photo.get_full_image(available_w, available_h)
+        pixmap = _get_full_pixmap(self.photo, available_w, available_h)
         if pixmap:
-            self.img_label.setPixmap(pixmap)
+            self._show_full_pixmap(pixmap, available_w, available_h, fit=True)
+            return
+
+        # Open right away and decode in the background
+        self.img_label.setText(tr("loading"))
+        self._set_image_state("loading")
+        self._resize_centered(self.MIN_WIDTH, self.MIN_HEIGHT)
+        self._start_loader(available_w, available_h)
+
+    def _set_image_state(self, state: str) -> None:
+        """Switch the image label style ("loading" or "error")"""
+        self.img_label.setProperty("state", state)
+        # Dynamic properties are only matched when the widget is polished
+        style = self.img_label.style()
+        style.unpolish(self.img_label)
+        style.polish(self.img_label)
+
+    def _start_loader(self, available_w: int, available_h: int) -> None:
+        """Decode the image for the given space on a worker thread"""
+        self._pending_size = (available_w, available_h)
+        self._loader = FullImageLoader(self.photo, available_w, available_h)
+        self._loader.signals.image_ready.connect(self._on_full_image_ready)
+        QThreadPool.globalInstance().start(self._loader)
+
+    def _on_full_image_ready(self, qimg: Optional[QImage], available_w: int, available_h: int) -> None:
+        """Display an image decoded by FullImageLoader"""
+        if sip.isdeleted(self) or (available_w, available_h) != self._pending_size:
+            return  # Dialog closed or a newer size requested meanwhile
+        self._pending_size = None
+        # First image of the dialog: size the window around it
+        first = self._last_rendered_size is None
+
+        if qimg is None:
+            if first:
+                self.img_label.setText(tr("loading_error"))
+                self._set_image_state("error")
+            return
+
+        pixmap = QPixmap.fromImage(qimg)
+        _put_full_pixmap(self.photo, available_w, available_h, pixmap)
+        if first and self._user_resized:
+            # Resized by the user while loading: keep their size and show the
+            # image decoded for it rather than this one, sized for the screen
+            self._reload_image()
+            return
+        self._show_full_pixmap(pixmap, available_w, available_h, fit=first)
+
+    def _show_full_pixmap(self, pixmap: QPixmap, available_w: int, available_h: int, fit: bool) -> None:
+        """Display a full-size pixmap, resizing the dialog around it if fit"""
+        self.img_label.setPixmap(pixmap)
+        self._last_rendered_size = (available_w, available_h)
+        if fit:
             # Adjust dialog size (include resize margins)
+            extra_margin = self.RESIZE_MARGIN * 2
             dialog_w = min(pixmap.width() + 80 + extra_margin, self.max_w)
             dialog_h = min(pixmap.height() + 180 + extra_margin, self.max_h)
-            self.resize(dialog_w, dialog_h)
+            self._resize_centered(dialog_w, dialog_h)
 
-            # Center on screen
-            screen = QApplication.primaryScreen().geometry()
-            x = (screen.width() - dialog_w) // 2
-            y = (screen.height() - dialog_h) // 2
-            self.move(x, y)
-        else:
-            self.img_label.setText(tr("loading_error"))
-            self.img_label.setStyleSheet(f"""
-                color: {Colors.DANGER};
-                font-size: 16px;
-                background: transparent;
-            """)
-            self.resize(400, 300)
+    def _resize_centered(self, dialog_w: int, dialog_h: int) -> None:
+        """Resize the dialog and center it on screen"""
+        self.resize(dialog_w, dialog_h)
+        screen = QApplication.primaryScreen().geometry()
+        x = (screen.width() - dialog_w) // 2
+        y = (screen.height() - dialog_h) // 2
+        self.move(x, y)
 
     def keyPressEvent(self, event: QKeyEvent) -> None:
         """Handle keyboard events"""
@@ -203,124 +379,107 @@ class ImageViewerDialog(QDialog):
         else:
             super().keyPressEvent(event)
 
-    def _get_resize_edge(self, pos: QPoint) -> str:
-        """Detect which edge/corner the mouse is on for resizing"""
-        rect = self.rect()
+    def _get_resize_edge(self, pos: QPoint) -> int:
+        """Detect which edge/corner the mouse is on for resizing (0 if none)"""
         margin = self.RESIZE_MARGIN
+        x = pos.x()
+        y = pos.y()
+        return ((y < margin) * _EDGE_TOP | (y > self.height() - margin) * _EDGE_BOTTOM
+                | (x < margin) * _EDGE_LEFT | (x > self.width() - margin) * _EDGE_RIGHT)
 
-        left = pos.x() < margin
-        right = pos.x() > rect.width() - margin
-        top = pos.y() < margin
-        bottom = pos.y() > rect.height() - margin
-
-        if top and left:
-            return "top-left"
-        elif top and right:
-            return "top-right"
-        elif bottom and left:
-            return "bottom-left"
-        elif bottom and right:
-            return "bottom-right"
-        elif left:
-            return "left"
-        elif right:
-            return "right"
-        elif top:
-            return "top"
-        elif bottom:
-            return "bottom"
-        return None
-
-    def _update_cursor(self, edge: str) -> None:
+    def _update_cursor(self, edge: int) -> None:
         """Update cursor based on resize edge"""
-        cursors = {
-            "left": Qt.SizeHorCursor,
-            "right": Qt.SizeHorCursor,
-            "top": Qt.SizeVerCursor,
-            "bottom": Qt.SizeVerCursor,
-            "top-left": Qt.SizeFDiagCursor,
-            "bottom-right": Qt.SizeFDiagCursor,
-            "top-right": Qt.SizeBDiagCursor,
-            "bottom-left": Qt.SizeBDiagCursor,
-        }
-        # Update hover state and trigger repaint for visual feedback
+        # Update hover state and repaint the old and new indicators only
         if self._hover_edge != edge:
+            self.update(self._edge_dirty_rect(self._hover_edge))
             self._hover_edge = edge
-            self.update()  # Trigger repaint
+            self.update(self._edge_dirty_rect(edge))
+            self.setCursor(_EDGE_CURSORS[edge])
 
-        if edge in cursors:
-            self.setCursor(cursors[edge])
-        else:
-            self.setCursor(Qt.ArrowCursor)
+    def _edge_dirty_rect(self, edge: int) -> QRect:
+        """Area painted by the hover indicator of an edge or corner"""
+        w = self.width()
+        h = self.height()
+        grip = self.GRIP_SIZE
+        thickness = self.EDGE_HIGHLIGHT_WIDTH
+        if edge == _EDGE_TOP_LEFT:
+            return QRect(0, 0, grip, grip)
+        if edge == _EDGE_TOP_RIGHT:
+            return QRect(w - grip, 0, grip, grip)
+        if edge == _EDGE_BOTTOM_LEFT:
+            return QRect(0, h - grip, grip, grip)
+        if edge == _EDGE_BOTTOM_RIGHT:
+            return QRect(w - grip, h - grip, grip, grip)
+        if edge == _EDGE_LEFT:
+            return QRect(0, 0, thickness, h)
+        if edge == _EDGE_RIGHT:
+            return QRect(w - thickness, 0, thickness, h)
+        if edge == _EDGE_TOP:
+            return QRect(0, 0, w, thickness)
+        if edge == _EDGE_BOTTOM:
+            return QRect(0, h - thickness, w, thickness)
+        return QRect()
+
+    def _grip_pixmap(self, corner: int) -> QPixmap:
+        """Pre-rendered hover grip of a corner (built on first use)"""
+        if self._grip_pixmaps is None:
+            highlight_color = QColor(Colors.PRIMARY)
+            highlight_color.setAlpha(180)
+            pen = QPen(highlight_color.darker(120), 2)
+            s = self.GRIP_SIZE
+            dpr = self.devicePixelRatioF()
+
+            # Diagonal grip lines of each corner, in grip-local coordinates
+            lines = {
+                _EDGE_BOTTOM_RIGHT: [(4, s, s, 4), (10, s, s, 10), (16, s, s, 16)],
+                _EDGE_BOTTOM_LEFT: [(0, 4, s - 4, s), (0, 10, s - 10, s), (0, 16, s - 16, s)],
+                _EDGE_TOP_RIGHT: [(s, s - 4, 4, 0), (s, s - 10, 10, 0), (s, s - 16, 16, 0)],
+                _EDGE_TOP_LEFT: [(0, s - 4, s - 4, 0), (0, s - 10, s - 10, 0), (0, s - 16, s - 16, 0)],
+            }
+
+            self._grip_pixmaps = {}
+            for name, segments in lines.items():
+                pixmap = QPixmap(int(s * dpr), int(s * dpr))
+                pixmap.setDevicePixelRatio(dpr)
+                pixmap.fill(Qt.transparent)
+                painter = QPainter(pixmap)
+                painter.setRenderHint(QPainter.Antialiasing)
+                painter.setPen(pen)
+                for x1, y1, x2, y2 in segments:
+                    painter.drawLine(x1, y1, x2, y2)
+                painter.end()
+                self._grip_pixmaps[name] = pixmap
+        return self._grip_pixmaps[corner]
 
     def paintEvent(self, event) -> None:
         """Draw resize indicators on edges"""
         super().paintEvent(event)
 
+        # No antialiasing: the grips are pre-rendered and the edges are
+        # axis-aligned fills
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        # Draw corner grips (always visible, subtle)
-        grip_color = QColor(Colors.PRIMARY)
-        grip_color.setAlpha(60)  # Subtle when not hovering
-
-        # Highlight color when hovering
-        highlight_color = QColor(Colors.PRIMARY)
-        highlight_color.setAlpha(180)
 
         rect = self.rect()
         grip = self.GRIP_SIZE
 
-        corners = {
-            "bottom-right": (rect.width() - grip, rect.height() - grip, grip, grip),
-            "bottom-left": (0, rect.height() - grip, grip, grip),
-            "top-right": (rect.width() - grip, 0, grip, grip),
-            "top-left": (0, 0, grip, grip),
-        }
-
-        for corner_name, (x, y, w, h) in corners.items():
-            # Use highlight color if this corner is being hovered
-            if self._hover_edge == corner_name:
-                painter.setBrush(QBrush(highlight_color))
-                painter.setPen(QPen(highlight_color.darker(120), 2))
-            else:
-                painter.setBrush(QBrush(grip_color))
-                painter.setPen(Qt.NoPen)
-
-            # Draw grip lines (diagonal lines in corner)
-            if corner_name == "bottom-right":
-                painter.drawLine(x + 4, y + h, x + w, y + 4)
-                painter.drawLine(x + 10, y + h, x + w, y + 10)
-                painter.drawLine(x + 16, y + h, x + w, y + 16)
-            elif corner_name == "bottom-left":
-                painter.drawLine(x, y + 4, x + w - 4, y + h)
-                painter.drawLine(x, y + 10, x + w - 10, y + h)
-                painter.drawLine(x, y + 16, x + w - 16, y + h)
-            elif corner_name == "top-right":
-                painter.drawLine(x + w, y + h - 4, x + 4, y)
-                painter.drawLine(x + w, y + h - 10, x + 10, y)
-                painter.drawLine(x + w, y + h - 16, x + 16, y)
-            elif corner_name == "top-left":
-                painter.drawLine(x, y + h - 4, x + w - 4, y)
-                painter.drawLine(x, y + h - 10, x + w - 10, y)
-                painter.drawLine(x, y + h - 16, x + w - 16, y)
+        # Corner grip of the hovered corner (idle grips have no pen, so
+        # they are not drawn at all)
+        corner = self._hover_edge
+        if corner in (_EDGE_TOP_LEFT, _EDGE_TOP_RIGHT, _EDGE_BOTTOM_LEFT, _EDGE_BOTTOM_RIGHT):
+            x = rect.width() - grip if corner & _EDGE_RIGHT else 0
+            y = rect.height() - grip if corner & _EDGE_BOTTOM else 0
+            painter.drawPixmap(x, y, self._grip_pixmap(corner))
 
         # Draw edge highlights when hovering
         edge_highlight = QColor(Colors.PRIMARY)
         edge_highlight.setAlpha(100)
-        pen = QPen(edge_highlight, 3)
-        painter.setPen(pen)
-        painter.setBrush(Qt.NoBrush)
 
         margin = 20  # Rounded corner offset
-        if self._hover_edge == "left":
-            painter.drawLine(0, margin, 0, rect.height() - margin)
-        elif self._hover_edge == "right":
-            painter.drawLine(rect.width(), margin, rect.width(), rect.height() - margin)
-        elif self._hover_edge == "top":
-            painter.drawLine(margin, 0, rect.width() - margin, 0)
-        elif self._hover_edge == "bottom":
-            painter.drawLine(margin, rect.height(), rect.width() - margin, rect.height())
+        edge = self._hover_edge
+        if edge in (_EDGE_LEFT, _EDGE_RIGHT):
+            painter.fillRect(self._edge_dirty_rect(edge).adjusted(0, margin, 0, -margin), edge_highlight)
+        elif edge in (_EDGE_TOP, _EDGE_BOTTOM):
+            painter.fillRect(self._edge_dirty_rect(edge).adjusted(margin, 0, -margin, 0), edge_highlight)
 
         painter.end()
 
@@ -355,9 +514,10 @@ class ImageViewerDialog(QDialog):
         """Handle mouse release - reload image after resize"""
         if self._resizing:
             self._resizing = False
-            self._resize_edge = None
+            self._resize_edge = 0
+            self._user_resized = True
             # Reload image at new size
-            self._reload_image()
+            self._reload_timer.start()
         self._drag_pos = None
         event.accept()
 
@@ -371,17 +531,17 @@ class ImageViewerDialog(QDialog):
 
         edge = self._resize_edge
 
-        if "right" in edge:
+        if edge & _EDGE_RIGHT:
             new_w = max(min_w, geo.width() + diff.x())
             geo.setWidth(min(new_w, self.max_w))
-        if "left" in edge:
+        if edge & _EDGE_LEFT:
             new_w = max(min_w, geo.width() - diff.x())
             if new_w <= self.max_w:
                 geo.setLeft(geo.right() - new_w)
-        if "bottom" in edge:
+        if edge & _EDGE_BOTTOM:
             new_h = max(min_h, geo.height() + diff.y())
             geo.setHeight(min(new_h, self.max_h))
-        if "top" in edge:
+        if edge & _EDGE_TOP:
             new_h = max(min_h, geo.height() - diff.y())
             if new_h <= self.max_h:
                 geo.setTop(geo.bottom() - new_h)
@@ -394,8 +554,16 @@ class ImageViewerDialog(QDialog):
         extra_margin = self.RESIZE_MARGIN * 2
         available_w = self.width() - 80 - extra_margin
         available_h = self.height() - 180 - extra_margin
+        available_w -= available_w % _RESIZE_BUCKET
+        available_h -= available_h % _RESIZE_BUCKET
+
+        if (available_w, available_h) in (self._last_rendered_size, self._pending_size):
+            return
 
         if available_w > 0 and available_h > 0:
-            pixmap = self.photo.get_full_image(available_w, available_h)
+            pixmap = _get_full_pixmap(self.photo, available_w, available_h)
             if pixmap:
-                self.img_label.setPixmap(pixmap)
+                self._pending_size = None
+                self._show_full_pixmap(pixmap, available_w, available_h, fit=False)
+            else:
+                self._start_loader(available_w, available_h)
@@ -1,7 +1,7 @@
 """Main application window"""
 
 import os
-from typing import List
+from typing import List, Set
 
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -16,11 +16,12 @@ from ..models import PhotoItem
 from ..config import SUPPORTED_FORMATS
 from ..export import WordExporter
 from ..i18n import Translations, Language, tr
-from .widgets import PhotoCard, AutoScrollArea, LoadMoreButton
+from .widgets import PhotoCard, AutoScrollArea, LoadMoreButton, ThumbnailLoader
 from .styles import Styles, Colors, SYSTEM_FONT
 
 # Number of photos to load at a time
 PHOTOS_BATCH_SIZE = 50
+CARDS_PER_TICK = 8  # Cards created per event loop iteration
 
 
 class PhotoManagerApp(QMainWindow):
@@ -34,7 +35,10 @@ class PhotoManagerApp(QMainWindow):
 
         self.photos: List[PhotoItem] = []
         self._cards: List[PhotoCard] = []
+        self._photo_paths: Set[str] = set()  # Paths in self.photos, for dedup
         self._photos_displayed = 0  # Number of photos currently displayed
+        self._grid_cols = 0  # Number of columns the cards are laid out on
+        self._cards_scheduled = False  # A batch of cards is queued
 
         # Apply theme
         self.setStyleSheet(Styles.get_main_stylesheet())
@@ -515,10 +519,13 @@ class PhotoManagerApp(QMainWindow):
         """Add all photos from a folder"""
         folder = QFileDialog.getExistingDirectory(self, tr("select_folder"))
         if folder:
-            files = sorted([
-                os.path.join(folder, f) for f in os.listdir(folder)
-                if f.lower().endswith(SUPPORTED_FORMATS) and not f.startswith('.')
-            ])
+            with os.scandir(folder) as it:
+                files = sorted(
+                    entry.path for entry in it
+                    if not entry.name.startswith('.')
+                    and entry.name.lower().endswith(SUPPORTED_FORMATS)
+                    and entry.is_file()
+                )
             if files:
                 self._add_photos(files)
 
@@ -533,8 +540,11 @@ class PhotoManagerApp(QMainWindow):
 
     def _add_photos(self, files: List[str]) -> None:
         """Add photos to the list"""
-        existing = {p.path for p in self.photos}
-        new_photos = [PhotoItem(f) for f in files if f not in existing]
+        new_photos = []
+        for f in files:
+            if f not in self._photo_paths:
+                self._photo_paths.add(f)
+                new_photos.append(PhotoItem(f))
         self.photos.extend(new_photos)
 
         # Reset displayed count to show first batch
@@ -545,6 +555,7 @@ class PhotoManagerApp(QMainWindow):
         """Delete a photo"""
         if 0 <= index < len(self.photos):
             self.photos[index].clear()
+            self._photo_paths.discard(self.photos[index].path)
             del self.photos[index]
             # Adjust displayed count
             self._photos_displayed = min(self._photos_displayed, len(self.photos))
@@ -573,7 +584,11 @@ class PhotoManagerApp(QMainWindow):
         remaining = len(self.photos) - self._photos_displayed
         to_load = min(PHOTOS_BATCH_SIZE, remaining)
         self._photos_displayed += to_load
-        self._refresh_grid()
+
+        # Only the new batch needs cards, existing ones are kept
+        self._add_cards()
+        self._update_loaded_label()
+        self._update_load_more()
 
     def _clear(self) -> None:
         """Clear all photos"""
@@ -591,6 +606,7 @@ class PhotoManagerApp(QMainWindow):
             for p in self.photos:
                 p.clear()
             self.photos.clear()
+            self._photo_paths.clear()
             self._photos_displayed = 0
             self._update_view()
 
@@ -633,6 +649,9 @@ class PhotoManagerApp(QMainWindow):
 
     def _refresh_grid(self) -> None:
         """Refresh the photo grid"""
+        # Thumbnails queued for the old cards are no longer needed
+        ThumbnailLoader.cancel_pending()
+
         # Clean existing cards
         for card in self._cards:
             card.deleteLater()
@@ -652,25 +671,65 @@ class PhotoManagerApp(QMainWindow):
         self._update_loaded_label()
 
         # Calculate columns dynamically
-        cols = self._calculate_columns()
+        self._grid_cols = self._calculate_columns()
 
         # Display photos up to _photos_displayed
+        self._add_cards()
+        self._update_load_more()
+
+    def _add_cards(self) -> None:
+        """Create the missing cards of the displayed photos
+
+        The first batch is created right away, the rest a few per event loop
+        iteration so the window keeps painting and responding meanwhile.
+        """
         displayed = min(self._photos_displayed, len(self.photos))
+        start = len(self._cards)
+        end = min(start + CARDS_PER_TICK, displayed)
 
-        for i in range(displayed):
+        cols = self._grid_cols
+        for i, photo in enumerate(self.photos[start:end], start):
             card = PhotoCard(
-                self.photos[i], i,
+                photo, i,
                 self._delete_photo, self._rotate_photo,
                 self._move_photo
             )
-            self.grid_layout.addWidget(card, i // cols, i % cols)
+            self.grid_layout.addWidget(card, *divmod(i, cols))
             self._cards.append(card)
 
-        # Show/hide load more button
+        # A single timer chain: a pending batch will pick up the rest
+        if end < displayed and not self._cards_scheduled:
+            self._cards_scheduled = True
+            QTimer.singleShot(0, self._add_next_cards)
+
+    def _add_next_cards(self) -> None:
+        """Create the next batch of cards (scheduled by _add_cards)"""
+        self._cards_scheduled = False
+        self._add_cards()
+
+    def _relayout_cards(self) -> None:
+        """Move the existing cards to the current number of columns"""
+        cols = self._calculate_columns()
+        if cols == self._grid_cols:
+            return
+        self._grid_cols = cols
+
+        # Detach the cards from the layout without destroying them
+        while self.grid_layout.count():
+            self.grid_layout.takeAt(0)
+        for i, card in enumerate(self._cards):
+            self.grid_layout.addWidget(card, *divmod(i, cols))
+
+    def _update_load_more(self) -> None:
+        """Show/hide load more button"""
+        displayed = min(self._photos_displayed, len(self.photos))
         if displayed < len(self.photos):
             remaining = len(self.photos) - displayed
             self.load_more_btn.setText(f"{tr('load_more')} ({remaining})")
             self.load_more_btn.show()
+
+            # Decode the next batch in the background so "load more" is instant
+            ThumbnailLoader.prefetch(self.photos[displayed:displayed + PHOTOS_BATCH_SIZE])
         else:
             self.load_more_btn.hide()
 
@@ -760,10 +819,13 @@ class PhotoManagerApp(QMainWindow):
 
     def _on_resize_done(self) -> None:
         """Called after resize is complete"""
-        if self.photos:
-            self._refresh_grid()
+        if self._cards:
+            self._relayout_cards()
 
     def closeEvent(self, event) -> None:
         """Clean up on close"""
         Translations.remove_listener(self._on_language_changed)
+        # Let running thumbnail decodes finish before the widgets go away
+        ThumbnailLoader.cancel_pending()
+        ThumbnailLoader.pool().waitForDone()
         super().closeEvent(event)
@@ -5,8 +5,8 @@ from PyQt5.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QGraphicsDropShadowEffect, QWidget, QApplication, QScrollArea
 )
-from PyQt5.QtCore import Qt, QPoint, QMimeData, pyqtSignal, QTimer, QObject
-from PyQt5.QtGui import QFont, QColor, QDrag, QPixmap, QCursor, QPainter, QLinearGradient, QPolygon
+from PyQt5.QtCore import Qt, QPoint, QMimeData, pyqtSignal, QTimer, QObject, QRunnable, QThreadPool
+from PyQt5.QtGui import QFont, QColor, QDrag, QPixmap, QImage, QCursor, QPainter, QLinearGradient, QPolygon, QTransform
 
 from ..models import PhotoItem
 from ..i18n import tr
@@ -49,6 +49,52 @@ class DragManager(QObject):
         return self._is_dragging
 
 
+class ThumbnailSignals(QObject):
+    """Signals for ThumbnailLoader (QRunnable is not a QObject)"""
+
+    thumbnail_ready = pyqtSignal(object, int)  # QImage or None, rotation
+
+
+class ThumbnailLoader(QRunnable):
+    """Decode a photo thumbnail on a worker thread"""
+
+    _pool = None
+
+    @classmethod
+    def pool(cls) -> QThreadPool:
+        """Thread pool shared by all thumbnail loads"""
+        if cls._pool is None:
+            cls._pool = QThreadPool()
+        return cls._pool
+
+    @classmethod
+    def cancel_pending(cls) -> None:
+        """Drop the loads that have not started yet"""
+        if cls._pool is not None:
+            cls._pool.clear()
+
+    @classmethod
+    def prefetch(cls, photos: List[PhotoItem]) -> None:
+        """Warm the thumbnail caches for photos without a card yet
+
+        Queued at low priority: loads of visible cards still go first.
+        """
+        pool = cls.pool()
+        for photo in photos:
+            pool.start(cls(photo), -1)
+
+    def __init__(self, photo: PhotoItem):
+        super().__init__()
+        self.photo = photo
+        self.rotation = photo.rotation
+        self.signals = ThumbnailSignals()
+
+    def run(self) -> None:
+        """Decode the thumbnail (QImage only, QPixmap is GUI-thread only)"""
+        qimg = self.photo.load_thumbnail()
+        self.signals.thumbnail_ready.emit(qimg, self.rotation)
+
+
 class ScrollZoneIndicator(QWidget):
     """Visual indicator for scroll zones during drag"""
 
@@ -482,8 +528,29 @@ class PhotoCard(QFrame):
         layout.addLayout(btn_container)
 
     def _load_image(self) -> None:
-        """Load the thumbnail"""
-        pixmap = self.photo.get_pixmap()
+        """Load the thumbnail (decoded off the GUI thread unless cached)"""
+        qimg = self.photo.cached_thumbnail()
+        if qimg is not None:
+            self._set_pixmap(QPixmap.fromImage(qimg))
+            return
+
+        # The current thumbnail (or the placeholder background) stays
+        # visible until the new one arrives
+        self._loader = ThumbnailLoader(self.photo)
+        self._loader.signals.thumbnail_ready.connect(self._on_thumbnail_ready)
+        ThumbnailLoader.pool().start(self._loader)
+
+    def _on_thumbnail_ready(self, qimg: Optional[QImage], rotation: int) -> None:
+        """Display a thumbnail decoded by ThumbnailLoader"""
+        if sip.isdeleted(self) or rotation != self.photo.rotation:
+            return  # Card destroyed or photo rotated again meanwhile
+        if qimg is None:
+            self._set_pixmap(None)
+        else:
+            self._set_pixmap(QPixmap.fromImage(qimg))
+
+    def _set_pixmap(self, pixmap: Optional[QPixmap]) -> None:
+        """Show the thumbnail, or an error if it could not be loaded"""
         if pixmap:
             # Scale while maintaining aspect ratio
             scaled = pixmap.scaled(
@@ -510,6 +577,12 @@ class PhotoCard(QFrame):
     def _rotate(self) -> None:
         """Rotate the photo"""
         self.photo.rotate()
+
+        # Turn the shown thumbnail right away, the decoded one replaces it
+        pixmap = self.img_label.pixmap()
+        if pixmap and not pixmap.isNull():
+            self._set_pixmap(pixmap.transformed(QTransform().rotate(90)))
+
         self._load_image()
         self.on_rotate(self.index)
 
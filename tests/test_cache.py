@@ -0,0 +1,45 @@
+"""Tests for the thumbnail caches"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from PIL import Image
+
+from src.models.cache import ThumbDiskCache
+
+
+class ThumbDiskCacheTest(unittest.TestCase):
+    """Files kept in the thumbnail cache directory"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmp_dir, 'cache')
+        os.makedirs(self.cache_dir)
+        self.photo = os.path.join(self.tmp_dir, 'photo.jpg')
+        Image.new('RGB', (100, 80), (255, 0, 0)).save(self.photo)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_stale_temporary_files_are_removed(self):
+        """Temporary files left by an interrupted write are swept, recent ones kept"""
+        stale = os.path.join(self.cache_dir, 'stale.jpg.1.tmp')
+        recent = os.path.join(self.cache_dir, 'recent.jpg.2.tmp')
+        for path in (stale, recent):
+            with open(path, 'wb') as f:
+                f.write(b'\0' * 1024)
+        old = time.time() - 3600
+        os.utime(stale, (old, old))
+
+        cache = ThumbDiskCache(self.cache_dir, 1 << 20, 80)
+        cache.get_or_build(self.photo, lambda: Image.new('RGB', (10, 10)))
+
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(recent))
+
+
+if __name__ == '__main__':
+    unittest.main()
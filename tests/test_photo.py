@@ -0,0 +1,61 @@
+"""Tests for the photo data model"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from PIL import Image
+
+from src.models import PhotoItem
+from src.models.cache import thumb_cache, thumb_disk_cache
+
+
+class BuildThumbnailTest(unittest.TestCase):
+    """Thumbnail decoding through the disk cache"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self._cache_dir = thumb_disk_cache.directory
+        thumb_disk_cache.directory = os.path.join(self.tmp_dir, 'cache')
+        thumb_cache.clear()
+
+    def tearDown(self):
+        thumb_disk_cache.directory = self._cache_dir
+        thumb_cache.clear()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_small_jpeg_without_exif(self):
+        """A JPEG already smaller than the thumbnail box is read before its file closes"""
+        path = os.path.join(self.tmp_dir, 'small.jpg')
+        Image.new('RGB', (100, 80), (255, 0, 0)).save(path)
+
+        qimg = PhotoItem(path).load_thumbnail()
+
+        self.assertIsNotNone(qimg)
+        self.assertEqual((qimg.width(), qimg.height()), (100, 80))
+        self.assertEqual(len(os.listdir(thumb_disk_cache.directory)), 1)
+
+    def test_files_sharing_a_prefix(self):
+        """Photos with the same size and first 16 KB do not share a thumbnail"""
+        paths = []
+        for name, color in (('red.jpg', (255, 0, 0)), ('blue.jpg', (0, 0, 255))):
+            path = os.path.join(self.tmp_dir, name)
+            # The 20 KB ICC block fills the first 16 KB identically
+            Image.new('RGB', (100, 80), color).save(path, icc_profile=b'\0' * 20000)
+            paths.append(path)
+
+        # Pad to the same size (data after the end of image is ignored)
+        size = max(os.path.getsize(path) for path in paths)
+        for path in paths:
+            with open(path, 'ab') as f:
+                f.write(b'\0' * (size - os.path.getsize(path)))
+
+        red, blue = (PhotoItem(path).load_thumbnail() for path in paths)
+
+        self.assertGreater(red.pixelColor(50, 40).red(), 200)
+        self.assertGreater(blue.pixelColor(50, 40).blue(), 200)
+
+
+if __name__ == '__main__':
+    unittest.main()